@@ -10,11 +10,12 @@ Example usage:
 
 """
 
-from gql import Client, gql
-from gql.transport.requests import RequestsHTTPTransport
+from http.cookiejar import DefaultCookiePolicy
+import functools
 
 import click
 import requests
+from requests.adapters import HTTPAdapter
 
 from newrelic_lambda_cli.cliutils import failure, success
 from newrelic_lambda_cli.types import (
@@ -26,6 +27,176 @@ from newrelic_lambda_cli.utils import parse_arn
 
 __cached_license_key = None
 
+# Enough connections for every `layers install --parallel` worker to query NerdGraph
+# at once while the license key has not been cached yet
+NERDGRAPH_POOL_SIZE = 50
+
+# Shared by every NewRelicGQL transport so that clients created for each function
+# in a batch reuse pooled connections rather than negotiating TLS again. NerdGraph
+# authenticates with the per-transport api-key header, so cookies are refused rather
+# than shared between clients that may be using different API keys.
+_session = requests.Session()
+_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+_session.mount("https://", HTTPAdapter(pool_maxsize=NERDGRAPH_POOL_SIZE))
+
+LINKED_ACCOUNTS_QUERY = """
+query ($accountId: Int!) {
+  actor {
+    account(id: $accountId) {
+      cloud {
+        linkedAccounts {
+          id
+          name
+          authLabel
+          externalId
+          metricCollectionMode
+        }
+      }
+    }
+  }
+}
+"""
+
+LICENSE_KEY_QUERY = """
+query ($accountId: Int!) {
+  requestContext {
+    apiKey
+  }
+  actor {
+    account(id: $accountId) {
+      licenseKey
+      id
+      name
+    }
+  }
+}
+"""
+
+LINK_ACCOUNT_MUTATION = """
+mutation ($accountId: Int!, $accounts: CloudLinkCloudAccountsInput!) {
+  cloudLinkAccount (accountId: $accountId, accounts: $accounts) {
+    linkedAccounts {
+      id
+      name
+      authLabel
+      externalId
+    }
+    errors {
+        message
+    }
+  }
+}
+"""
+
+UNLINK_ACCOUNT_MUTATION = """
+mutation ($accountId: Int!, $accounts: [CloudUnlinkAccountsInput!]!) {
+  cloudUnlinkAccount (accountId: $accountId, accounts: $accounts) {
+    unlinkedAccounts {
+      id
+      name
+    }
+    errors {
+      type
+      message
+    }
+  }
+}
+"""
+
+INTEGRATIONS_QUERY = """
+query ($accountId: Int!, $linkedAccountId: Int!) {
+  actor {
+    account (id: $accountId) {
+      cloud {
+        linkedAccount(id: $linkedAccountId) {
+          integrations {
+            id
+            name
+            createdAt
+            updatedAt
+            service {
+              slug
+              isEnabled
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+INTEGRATION_SERVICES_QUERY = """
+query ($accountId: Int!, $linkedAccountId: Int!) {
+  actor {
+    account (id: $accountId) {
+      cloud {
+        linkedAccount(id: $linkedAccountId) {
+          integrations {
+            service {
+              slug
+              isEnabled
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+ENABLE_INTEGRATION_MUTATION = """
+mutation ($accountId: Int!, $integrations: CloudIntegrationsInput!) {
+  cloudConfigureIntegration (
+    accountId: $accountId,
+    integrations: $integrations
+  ) {
+    integrations {
+      id
+      name
+      service {
+        id
+        name
+      }
+    }
+    errors {
+      linkedAccountId
+      message
+    }
+  }
+}
+"""
+
+DISABLE_INTEGRATION_MUTATION = """
+mutation ($accountId: Int!, $integrations: CloudIntegrationsInput!) {
+  cloudDisableIntegration (
+    accountId: $accountId,
+    integrations: $integrations
+  ) {
+    disabledIntegrations {
+      id
+      accountId
+      name
+    }
+    errors {
+      type
+      message
+    }
+  }
+}
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_query(query):
+    """
+    Parses a GraphQL query once. gql is imported here rather than at module level
+    because it is slow to import and most commands never talk to New Relic.
+    """
+    from gql import gql
+
+    return gql(query)
+
 
 class NewRelicGQL(object):
     def __init__(self, account_id, api_key, region="us"):
@@ -45,67 +216,47 @@ class NewRelicGQL(object):
         else:
             raise ValueError("Region must be one of 'us' or 'eu'")
 
+        from gql import Client
+        from gql.transport.requests import RequestsHTTPTransport
+
         transport = RequestsHTTPTransport(url=self.url, use_json=True)
         transport.headers = {"api-key": self.api_key}
+        transport.session = _session
 
-        try:
-            self.client = Client(transport=transport, fetch_schema_from_transport=True)
-        except Exception:
-            self.client = Client(transport=transport, fetch_schema_from_transport=False)
+        self.client = Client(transport=transport, fetch_schema_from_transport=False)
+        self._linked_accounts = None
 
     def query(self, query, timeout=None, **variable_values):
         return self.client.execute(
-            gql(query), timeout=timeout, variable_values=variable_values or None
+            _parse_query(query),
+            timeout=timeout,
+            variable_values=variable_values,
         )
 
     def get_linked_accounts(self):
         """
         return a list of linked accounts for the New Relic account
+
+        The list is cached on this instance until an account is linked or unlinked.
         """
+        if self._linked_accounts is not None:
+            return self._linked_accounts
         res = self.query(
-            """
-            query ($accountId: Int!) {
-              actor {
-                account(id: $accountId) {
-                  cloud {
-                    linkedAccounts {
-                      id
-                      name
-                      authLabel
-                      externalId
-                      metricCollectionMode
-                    }
-                  }
-                }
-              }
-            }
-            """,
+            LINKED_ACCOUNTS_QUERY,
             accountId=self.account_id,
         )
         try:
-            return res["actor"]["account"]["cloud"]["linkedAccounts"]
+            self._linked_accounts = res["actor"]["account"]["cloud"]["linkedAccounts"]
         except KeyError:
             return []
+        return self._linked_accounts
 
     def get_license_key(self):
         """
         Fetch the license key for the NR Account
         """
         res = self.query(
-            """
-            query ($accountId: Int!) {
-              requestContext {
-                apiKey
-              }
-              actor {
-                account(id: $accountId) {
-                  licenseKey
-                  id
-                  name
-                }
-              }
-            }
-            """,
+            LICENSE_KEY_QUERY,
             accountId=self.account_id,
         )
         try:
@@ -139,24 +290,11 @@ class NewRelicGQL(object):
         in the New Relic account
         """
         res = self.query(
-            """
-            mutation ($accountId: Int!, $accounts: CloudLinkCloudAccountsInput!) {
-              cloudLinkAccount (accountId: $accountId, accounts: $accounts) {
-                linkedAccounts {
-                  id
-                  name
-                  authLabel
-                  externalId
-                }
-                errors {
-                    message
-                }
-              }
-            }
-            """,
+            LINK_ACCOUNT_MUTATION,
             accountId=self.account_id,
             accounts={"aws": {"arn": role_arn, "name": account_name}},
         )
+        self._linked_accounts = None
         try:
             return res["cloudLinkAccount"]["linkedAccounts"][0]
         except (IndexError, KeyError):
@@ -178,23 +316,11 @@ class NewRelicGQL(object):
         Unlink a New Relic Cloud integrations account
         """
         res = self.query(
-            """
-            mutation ($accountId: Int!, $accounts: [CloudUnlinkAccountsInput!]!) {
-              cloudUnlinkAccount (accountId: $accountId, accounts: $accounts) {
-                unlinkedAccounts {
-                  id
-                  name
-                }
-                errors {
-                  type
-                  message
-                }
-              }
-            }
-            """,
+            UNLINK_ACCOUNT_MUTATION,
             accountId=self.account_id,
             accounts=[{"linkedAccountId": linked_account_id}],
         )
+        self._linked_accounts = None
         if "errors" in res and res["errors"]:
             failure(
                 "Error while unlinking account with New Relic:\n%s"
@@ -207,28 +333,7 @@ class NewRelicGQL(object):
         returns the integrations for the linked account
         """
         res = self.query(
-            """
-            query ($accountId: Int!, $linkedAccountId: Int!) {
-              actor {
-                account (id: $accountId) {
-                  cloud {
-                    linkedAccount(id: $linkedAccountId) {
-                      integrations {
-                        id
-                        name
-                        createdAt
-                        updatedAt
-                        service {
-                          slug
-                          isEnabled
-                        }
-                      }
-                    }
-                  }
-                }
-              }
-            }
-            """,
+            INTEGRATIONS_QUERY,
             accountId=self.account_id,
             linkedAccountId=int(linked_account_id),
         )
@@ -247,11 +352,21 @@ class NewRelicGQL(object):
             return None
 
     def is_integration_enabled(self, linked_account_id, service_slug):
-        integration = self.get_integration_by_service_slug(
-            linked_account_id, service_slug
+        """
+        returns whether the integration is enabled for the linked account, fetching
+        only the service fields needed to tell
+        """
+        res = self.query(
+            INTEGRATION_SERVICES_QUERY,
+            accountId=self.account_id,
+            linkedAccountId=int(linked_account_id),
         )
         try:
-            return integration and integration["service"]["isEnabled"]
+            linked_account = res["actor"]["account"]["cloud"]["linkedAccount"]
+            return any(
+                i["service"]["slug"] == service_slug and i["service"]["isEnabled"]
+                for i in linked_account["integrations"]
+            )
         except KeyError:
             return False
 
@@ -260,27 +375,7 @@ class NewRelicGQL(object):
         enable monitoring of a Cloud provider service (integration)
         """
         res = self.query(
-            """
-            mutation ($accountId: Int!, $integrations: CloudIntegrationsInput!) {
-              cloudConfigureIntegration (
-                accountId: $accountId,
-                integrations: $integrations
-              ) {
-                integrations {
-                  id
-                  name
-                  service {
-                    id
-                    name
-                  }
-                }
-                errors {
-                  linkedAccountId
-                  message
-                }
-              }
-            }
-            """,
+            ENABLE_INTEGRATION_MUTATION,
             accountId=self.account_id,
             integrations={
                 provider_slug: {service_slug: [{"linkedAccountId": linked_account_id}]}
@@ -301,24 +396,7 @@ class NewRelicGQL(object):
         Disable monitoring of a Cloud provider service (integration)
         """
         res = self.query(
-            """
-            mutation ($accountId: Int!, $integrations: CloudIntegrationsInput!) {
-              cloudDisableIntegration (
-                accountId: $accountId,
-                integrations: $integrations
-              ) {
-                disabledIntegrations {
-                  id
-                  accountId
-                  name
-                }
-                errors {
-                  type
-                  message
-                }
-              }
-            }
-            """,
+            DISABLE_INTEGRATION_MUTATION,
             accountId=self.account_id,
             integrations={
                 provider_slug: {service_slug: [{"linkedAccountId": linked_account_id}]}
@@ -5,7 +5,7 @@ from concurrent.futures import as_completed, ThreadPoolExecutor
 import boto3
 import click
 
-from newrelic_lambda_cli import layers, permissions
+from newrelic_lambda_cli import layers, permissions, utils
 from newrelic_lambda_cli.cli.decorators import add_options, AWS_OPTIONS
 from newrelic_lambda_cli.cliutils import done, failure
 from newrelic_lambda_cli.functions import get_aliased_functions
@@ -103,6 +103,14 @@ def register(group):
     show_default=True,
     type=click.Choice(["handleRequest", "handleStreamsRequest"]),
 )
+@click.option(
+    "--parallel",
+    default=16,
+    help="Maximum number of functions to update concurrently",
+    metavar="<count>",
+    show_default=True,
+    type=click.IntRange(min=1, max=utils.MAX_PARALLEL_UPDATES),
+)
 @click.pass_context
 def install(ctx, **kwargs):
     """Install New Relic AWS Lambda Layers"""
@@ -119,9 +127,12 @@ def install(ctx, **kwargs):
 
     functions = get_aliased_functions(input)
 
-    with ThreadPoolExecutor() as executor:
+    client = utils.get_lambda_client(input.session)
+
+    with ThreadPoolExecutor(max_workers=input.parallel) as executor:
         futures = [
-            executor.submit(layers.install, input, function) for function in functions
+            executor.submit(layers.install, input, function, client)
+            for function in functions
         ]
         install_success = all(future.result() for future in as_completed(futures))
 
@@ -174,6 +185,14 @@ def install(ctx, **kwargs):
     metavar="<name>",
     multiple=True,
 )
+@click.option(
+    "--parallel",
+    default=16,
+    help="Maximum number of functions to update concurrently",
+    metavar="<count>",
+    show_default=True,
+    type=click.IntRange(min=1, max=utils.MAX_PARALLEL_UPDATES),
+)
 @click.pass_context
 def uninstall(ctx, **kwargs):
     """Uninstall New Relic AWS Lambda Layers"""
@@ -190,9 +209,12 @@ def uninstall(ctx, **kwargs):
 
     functions = get_aliased_functions(input)
 
-    with ThreadPoolExecutor() as executor:
+    client = utils.get_lambda_client(input.session)
+
+    with ThreadPoolExecutor(max_workers=input.parallel) as executor:
         futures = [
-            executor.submit(layers.uninstall, input, function) for function in functions
+            executor.submit(layers.uninstall, input, function, client)
+            for function in functions
         ]
         uninstall_success = all(future.result() for future in as_completed(futures))
 
@@ -11,35 +11,38 @@ from newrelic_lambda_cli.types import (
 )
 from newrelic_lambda_cli import utils
 
+# Predicates applied to a function's New Relic layer status for each list filter
+FUNCTION_FILTERS = {
+    "all": lambda enabled: True,
+    "installed": lambda enabled: enabled,
+    "not-installed": lambda enabled: not enabled,
+}
+
 
 @utils.catch_boto_errors
 def list_functions(session, filter=None):
-    client = session.client("lambda")
+    client = utils.get_lambda_client(session)
 
-    all = filter == "all" or not filter
+    prefix = utils.get_arn_prefix(session.region_name)
+    predicate = FUNCTION_FILTERS.get(filter, FUNCTION_FILTERS["all"])
 
     pager = client.get_paginator("list_functions")
-    for res in pager.paginate():
-        funcs = res.get("Functions", [])
-        for func in funcs:
-            func.setdefault("x-new-relic-enabled", False)
-            for layer in func.get("Layers", []):
-                if layer.get("Arn", "").startswith(
-                    utils.get_arn_prefix(session.region_name)
-                ):
-                    func["x-new-relic-enabled"] = True
-            if all:
-                yield func
-            elif filter == "installed" and func["x-new-relic-enabled"]:
-                yield func
-            elif filter == "not-installed" and not func["x-new-relic-enabled"]:
-                yield func
-
-
-def get_function(session, function_name):
+    pages = pager.paginate(PaginationConfig={"PageSize": 50})
+    for func in pages.search("Functions[]"):
+        enabled = any(
+            layer.get("Arn", "").startswith(prefix) for layer in func.get("Layers", [])
+        )
+        # Annotated for callers such as `functions list` that display the status
+        func["x-new-relic-enabled"] = enabled
+        if predicate(enabled):
+            yield func
+
+
+def get_function(session, function_name, client=None):
     """Returns details about an AWS lambda function"""
+    client = client or utils.get_lambda_client(session)
     try:
-        return session.client("lambda").get_function(FunctionName=function_name)
+        return client.get_function(FunctionName=function_name)
     except botocore.exceptions.ClientError as e:
         if (
             e.response
@@ -15,7 +15,11 @@ from newrelic_lambda_cli.types import (
     IntegrationUninstall,
     IntegrationUpdate,
 )
-from newrelic_lambda_cli.utils import catch_boto_errors, NR_DOCS_ACT_LINKING_URL
+from newrelic_lambda_cli.utils import (
+    catch_boto_errors,
+    get_lambda_client,
+    NR_DOCS_ACT_LINKING_URL,
+)
 
 INGEST_STACK_NAME = "NewRelicLogIngestion"
 LICENSE_KEY_STACK_NAME = "NewRelicLicenseKeySecret"
@@ -334,7 +338,7 @@ def update_log_ingestion_function(input):
         ] = "Retain"
 
         # We can't change props during import, so let's set them to their current values
-        lambda_client = input.session.client("lambda")
+        lambda_client = get_lambda_client(input.session)
         old_props = lambda_client.get_function_configuration(
             FunctionName="newrelic-log-ingestion"
         )
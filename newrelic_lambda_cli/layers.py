@@ -82,45 +82,40 @@ def _add_new_relic(input, config, nr_license_key):
     assert isinstance(input, LayerInstall)
 
     aws_region = input.session.region_name
+    configuration = config["Configuration"]
 
-    runtime = config["Configuration"]["Runtime"]
+    runtime = configuration["Runtime"]
     if runtime not in utils.RUNTIME_CONFIG:
         failure(
             "Unsupported Lambda runtime for '%s': %s"
-            % (config["Configuration"]["FunctionArn"], runtime)
+            % (configuration["FunctionArn"], runtime)
         )
         return True
 
-    architectures = config["Configuration"].get("Architectures", ["x86_64"])
+    architectures = configuration.get("Architectures", ["x86_64"])
     architecture = architectures[0]
 
-    handler = config["Configuration"]["Handler"]
+    handler = configuration["Handler"]
     runtime_handler = utils.RUNTIME_CONFIG.get(runtime, {}).get("Handler")
 
     if "java" in runtime:
         postfix = input.java_handler_method or "handleRequest"
         runtime_handler = runtime_handler + postfix
 
-    existing_newrelic_layer = [
-        layer["Arn"]
-        for layer in config["Configuration"].get("Layers", [])
-        if layer["Arn"].startswith(utils.get_arn_prefix(aws_region))
-    ]
+    prefix = utils.get_arn_prefix(aws_region)
+
+    layer_arns = [layer["Arn"] for layer in configuration.get("Layers", [])]
+    existing_layers = [arn for arn in layer_arns if not arn.startswith(prefix)]
 
-    if not input.upgrade and existing_newrelic_layer:
+    # Any layers filtered out above are New Relic layers
+    if not input.upgrade and len(existing_layers) < len(layer_arns):
         success(
             "Already installed on function '%s'. Pass --upgrade (or -u) to allow "
             "upgrade or reinstall to latest layer version."
-            % config["Configuration"]["FunctionArn"]
+            % configuration["FunctionArn"]
         )
         return True
 
-    existing_layers = [
-        layer["Arn"]
-        for layer in config["Configuration"].get("Layers", [])
-        if not layer["Arn"].startswith(utils.get_arn_prefix(aws_region))
-    ]
-
     new_relic_layer = []
 
     if input.layer_arn:
@@ -132,19 +127,17 @@ def _add_new_relic(input, config, nr_license_key):
         if not available_layers:
             failure(
                 "No Lambda layers published for %s (%s) runtime: %s"
-                % (config["Configuration"]["FunctionArn"], runtime, architecture)
+                % (configuration["FunctionArn"], runtime, architecture)
             )
             return False
 
         new_relic_layer = layer_selection(available_layers, runtime, architecture)
 
+    env_vars = dict(configuration.get("Environment", {}).get("Variables", {}))
+
     update_kwargs = {
-        "FunctionName": config["Configuration"]["FunctionArn"],
-        "Environment": {
-            "Variables": config["Configuration"]
-            .get("Environment", {})
-            .get("Variables", {})
-        },
+        "FunctionName": configuration["FunctionArn"],
+        "Environment": {"Variables": env_vars},
         "Layers": [new_relic_layer] + existing_layers,
     }
 
@@ -159,13 +152,11 @@ def _add_new_relic(input, config, nr_license_key):
         update_kwargs["Handler"] = runtime_handler
 
     # Update the account id
-    update_kwargs["Environment"]["Variables"]["NEW_RELIC_ACCOUNT_ID"] = str(
-        input.nr_account_id
-    )
+    env_vars["NEW_RELIC_ACCOUNT_ID"] = str(input.nr_account_id)
 
     # Update the NEW_RELIC_LAMBDA_HANDLER envvars only when it's a new install.
     if runtime_handler and handler != runtime_handler:
-        update_kwargs["Environment"]["Variables"]["NEW_RELIC_LAMBDA_HANDLER"] = handler
+        env_vars["NEW_RELIC_LAMBDA_HANDLER"] = handler
 
     if input.enable_extension and not utils.supports_lambda_extension(runtime):
         warning(
@@ -173,45 +164,39 @@ def _add_new_relic(input, config, nr_license_key):
             "CloudWatch Logs based ingestion. Make sure you run `newrelic-lambda "
             "integrations install` command to install the New Relic log ingestion "
             "function and `newrelic-lambda subscriptions install` to create the log "
-            "subscription filter." % (runtime, config["Configuration"]["FunctionName"])
+            "subscription filter." % (runtime, configuration["FunctionName"])
         )
 
     if input.enable_extension and utils.supports_lambda_extension(runtime):
-        update_kwargs["Environment"]["Variables"][
-            "NEW_RELIC_LAMBDA_EXTENSION_ENABLED"
-        ] = "true"
+        env_vars["NEW_RELIC_LAMBDA_EXTENSION_ENABLED"] = "true"
 
-        update_kwargs["Environment"]["Variables"][
-            "NEW_RELIC_EXTENSION_SEND_FUNCTION_LOGS"
-        ] = ("true" if input.enable_extension_function_logs else "false")
+        env_vars["NEW_RELIC_EXTENSION_SEND_FUNCTION_LOGS"] = (
+            "true" if input.enable_extension_function_logs else "false"
+        )
 
         if input.nr_region == "staging":
-            update_kwargs["Environment"]["Variables"][
+            env_vars[
                 "NEW_RELIC_TELEMETRY_ENDPOINT"
             ] = "https://staging-cloud-collector.newrelic.com/aws/lambda/v1"
-            update_kwargs["Environment"]["Variables"][
+            env_vars[
                 "NEW_RELIC_LOG_ENDPOINT"
             ] = "https://staging-log-api.newrelic.com/log/v1"
 
         if nr_license_key:
-            update_kwargs["Environment"]["Variables"][
-                "NEW_RELIC_LICENSE_KEY"
-            ] = nr_license_key
+            env_vars["NEW_RELIC_LICENSE_KEY"] = nr_license_key
     else:
-        update_kwargs["Environment"]["Variables"][
-            "NEW_RELIC_LAMBDA_EXTENSION_ENABLED"
-        ] = "false"
+        env_vars["NEW_RELIC_LAMBDA_EXTENSION_ENABLED"] = "false"
 
     return update_kwargs
 
 
 @catch_boto_errors
-def install(input, function_arn):
+def install(input, function_arn, client=None):
     assert isinstance(input, LayerInstall)
 
-    client = input.session.client("lambda")
+    client = client or utils.get_lambda_client(input.session)
 
-    config = get_function(input.session, function_arn)
+    config = get_function(input.session, function_arn, client)
     if not config:
         failure("Could not find function: %s" % function_arn)
         return False
@@ -291,16 +276,17 @@ def _remove_new_relic(input, config):
     assert isinstance(input, LayerUninstall)
 
     aws_region = input.session.region_name
+    configuration = config["Configuration"]
 
-    runtime = config["Configuration"]["Runtime"]
+    runtime = configuration["Runtime"]
     if runtime not in utils.RUNTIME_CONFIG:
         failure(
             "Unsupported Lambda runtime for '%s': %s"
-            % (config["Configuration"]["FunctionArn"], runtime)
+            % (configuration["FunctionArn"], runtime)
         )
         return True
 
-    handler = config["Configuration"]["Handler"]
+    handler = configuration["Handler"]
 
     # For java runtimes we need to remove the method name before
     # validating because method names are variable
@@ -312,49 +298,41 @@ def _remove_new_relic(input, config):
         failure(
             "New Relic installation (via layers) not auto-detected for the specified "
             "function '%s'. Unrecognized handler in deployed function."
-            % config["Configuration"]["FunctionArn"]
+            % configuration["FunctionArn"]
         )
         return False
 
-    env_handler = (
-        config["Configuration"]
-        .get("Environment", {})
-        .get("Variables", {})
-        .get("NEW_RELIC_LAMBDA_HANDLER")
-    )
+    env_vars = configuration.get("Environment", {}).get("Variables", {})
+    env_handler = env_vars.get("NEW_RELIC_LAMBDA_HANDLER")
 
     # Delete New Relic env vars
-    config["Configuration"]["Environment"]["Variables"] = {
-        key: value
-        for key, value in config["Configuration"]
-        .get("Environment", {})
-        .get("Variables", {})
-        .items()
-        if key not in NEW_RELIC_ENV_VARS
+    env_vars = {
+        key: value for key, value in env_vars.items() if key not in NEW_RELIC_ENV_VARS
     }
 
     # Remove New Relic layers
+    prefix = utils.get_arn_prefix(aws_region)
     layers = [
         layer["Arn"]
-        for layer in config["Configuration"].get("Layers")
-        if not layer["Arn"].startswith(utils.get_arn_prefix(aws_region))
+        for layer in configuration.get("Layers", [])
+        if not layer["Arn"].startswith(prefix)
     ]
 
     return {
-        "FunctionName": config["Configuration"]["FunctionArn"],
-        "Handler": env_handler if env_handler else config["Configuration"]["Handler"],
-        "Environment": config["Configuration"]["Environment"],
+        "FunctionName": configuration["FunctionArn"],
+        "Handler": env_handler if env_handler else configuration["Handler"],
+        "Environment": {"Variables": env_vars},
         "Layers": layers,
     }
 
 
 @catch_boto_errors
-def uninstall(input, function_arn):
+def uninstall(input, function_arn, client=None):
     assert isinstance(input, LayerUninstall)
 
-    client = input.session.client("lambda")
+    client = client or utils.get_lambda_client(input.session)
 
-    config = get_function(input.session, function_arn)
+    config = get_function(input.session, function_arn, client)
     if not config:
         failure("Could not find function: %s" % function_arn)
         return False
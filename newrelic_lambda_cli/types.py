@@ -62,6 +62,7 @@ LAYER_INSTALL_KEYS = [
     "enable_extension",
     "enable_extension_function_logs",
     "java_handler_method",
+    "parallel",
 ]
 
 LAYER_UNINSTALL_KEYS = [
@@ -72,6 +73,7 @@ LAYER_UNINSTALL_KEYS = [
     "aws_permissions_check",
     "functions",
     "excludes",
+    "parallel",
 ]
 
 SUBSCRIPTION_INSTALL_KEYS = [
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import functools
 import sys
 
 import boto3
 import botocore
+from botocore.config import Config
 import click
 
 NR_DOCS_ACT_LINKING_URL = "https://docs.newrelic.com/docs/serverless-function-monitoring/aws-lambda-monitoring/enable-lambda-monitoring/account-linking/#manually-configuring-the-license-key-secret"
@@ -49,6 +51,12 @@ RUNTIME_CONFIG = {
         "LambdaExtension": True,
     },
 }
+# Upper bound on concurrent function updates, so that every worker thread can hold
+# its own pooled connection
+MAX_PARALLEL_UPDATES = 50
+LAMBDA_CLIENT_CONFIG = Config(
+    max_pool_connections=MAX_PARALLEL_UPDATES, retries={"mode": "adaptive"}
+)
 
 
 def catch_boto_errors(func):
@@ -67,6 +75,7 @@ def catch_boto_errors(func):
     return _boto_error_wrapper
 
 
+@functools.lru_cache(maxsize=32)
 def get_arn_prefix(region):
     return NEW_RELIC_ARN_PREFIX_TEMPLATE % (get_region(region),)
 
@@ -82,7 +91,7 @@ def get_region(region):
 
 @catch_boto_errors
 def get_lambda_client(session):
-    return session.client("lambda")
+    return session.client("lambda", config=LAMBDA_CLIENT_CONFIG)
 
 
 @catch_boto_errors
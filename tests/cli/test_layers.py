@@ -1,4 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 from moto import mock_lambda
+import pytest
 
 from newrelic_lambda_cli.cli import cli, register_groups
 
@@ -121,3 +125,78 @@ def test_layers_uninstall(aws_credentials, cli_runner):
     assert result2.exit_code == 1
     assert result2.stdout == ""
     assert "Could not find function: foobar" in result2.stderr
+
+
+@mock_lambda
+@pytest.mark.parametrize("command", ["install", "uninstall"])
+@pytest.mark.parametrize("parallel,max_workers", [([], 16), (["--parallel", "2"], 2)])
+def test_layers_parallel(aws_credentials, cli_runner, command, parallel, max_workers):
+    """
+    Assert that '--parallel' sets the number of workers used to update functions
+    """
+    register_groups(cli)
+
+    args = ["layers", command, "--no-aws-permissions-check", "--function", "foobar"]
+    if command == "install":
+        args += ["--nr-account-id", "12345678"]
+
+    with patch(
+        "newrelic_lambda_cli.cli.layers.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+    ) as mock_executor:
+        result = cli_runner.invoke(
+            cli,
+            args + ["--aws-region", "us-east-1"] + parallel,
+            env={
+                "AWS_ACCESS_KEY_ID": "testing",
+                "AWS_SECRET_ACCESS_KEY": "testing",
+                "AWS_SECURITY_TOKEN": "testing",
+                "AWS_SESSION_TOKEN": "testing",
+            },
+        )
+
+    assert "Could not find function: foobar" in result.stderr
+    mock_executor.assert_called_once_with(max_workers=max_workers)
+
+
+@pytest.mark.parametrize("command", ["install", "uninstall"])
+def test_layers_parallel_limit(cli_runner, command):
+    """
+    Assert that '--parallel' is capped at the Lambda client's connection pool size
+    """
+    register_groups(cli)
+
+    result = cli_runner.invoke(
+        cli, ["layers", command, "--function", "foobar", "--parallel", "51"]
+    )
+
+    assert result.exit_code == 2
+    assert "--parallel" in result.stderr
+
+
+@pytest.mark.parametrize("command", ["install", "uninstall"])
+def test_layers_share_lambda_client(cli_runner, command):
+    """
+    Assert that one Lambda client is built per command and passed to every function
+    update
+    """
+    register_groups(cli)
+
+    args = ["layers", command, "--function", "foo", "--function", "bar"]
+    args += ["--aws-region", "us-east-1"]
+    if command == "install":
+        args += ["--nr-account-id", "12345678"]
+
+    with patch(
+        "newrelic_lambda_cli.cli.layers.utils.get_lambda_client"
+    ) as mock_get_lambda_client, patch(
+        "newrelic_lambda_cli.cli.layers.layers.%s" % command, return_value=True
+    ) as mock_command:
+        result = cli_runner.invoke(cli, args)
+
+    assert result.exit_code == 0, result.stderr
+    mock_get_lambda_client.assert_called_once()
+    client = mock_get_lambda_client.return_value
+    assert sorted(c.args[1:] for c in mock_command.call_args_list) == [
+        ("bar", client),
+        ("foo", client),
+    ]
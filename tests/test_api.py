@@ -37,6 +37,7 @@ def test_create_integration_account():
         "name": "Foo Bar",
     }
 
+    mock_gql = NewRelicGQL("123456789", "foobar")
     mock_gql.query = Mock(
         side_effect=(
             {"actor": {"account": {"cloud": {"linkedAccounts": []}}}},
@@ -74,6 +75,7 @@ def test_enable_lambda_integration():
     ), "Account should be linked to enable the lambda integration"
     assert mock_gql.query.call_count == 1
 
+    mock_gql = NewRelicGQL("123456789", "foobar")
     mock_gql.query = Mock(
         side_effect=(
             {
@@ -102,6 +104,7 @@ def test_enable_lambda_integration():
         lambda_enabled is True
     ), "Accounts in PUSH mode (using Cloudwatch Metrics stream) should already have the Lambda integration enabled"
 
+    mock_gql = NewRelicGQL("123456789", "foobar")
     mock_gql.query = Mock(
         side_effect=(
             {
@@ -143,6 +146,7 @@ def test_enable_lambda_integration():
         lambda_enabled is True
     ), "Account is linked and already has the lambda integration enabled"
 
+    mock_gql = NewRelicGQL("123456789", "foobar")
     mock_gql.query = Mock(
         side_effect=(
             {
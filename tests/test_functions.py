@@ -4,6 +4,7 @@ from moto import mock_lambda
 from unittest.mock import MagicMock
 
 from newrelic_lambda_cli.functions import get_aliased_functions, list_functions
+from newrelic_lambda_cli.utils import get_arn_prefix
 
 from .conftest import layer_install
 
@@ -68,10 +69,38 @@ def test_list_functions(aws_credentials):
     mock_session = MagicMock()
     mock_client = mock_session.client.return_value
     mock_pager = mock_client.get_paginator.return_value
-    mock_pager.paginate.return_value = [
-        {"Functions": [{"FunctionName": "foobar", "Layers": []}]}
+    mock_pager.paginate.return_value.search.return_value = [
+        {"FunctionName": "foobar", "Layers": []}
     ]
 
     assert list(list_functions(mock_session)) == [
         {"FunctionName": "foobar", "Layers": [], "x-new-relic-enabled": False}
     ]
+
+
+def test_list_functions_filter(aws_credentials):
+    mock_session = MagicMock()
+    mock_session.region_name = "us-east-1"
+    mock_client = mock_session.client.return_value
+    mock_pager = mock_client.get_paginator.return_value
+    mock_pager.paginate.return_value.search.side_effect = lambda _: iter(
+        [
+            {"FunctionName": "foo", "Layers": [{"Arn": "other_layer_arn"}]},
+            {
+                "FunctionName": "bar",
+                "Layers": [
+                    {"Arn": "other_layer_arn"},
+                    {"Arn": get_arn_prefix("us-east-1") + ":layer:NewRelicPython37:1"},
+                ],
+            },
+            {"FunctionName": "baz"},
+        ]
+    )
+
+    def _names(filter):
+        return [f["FunctionName"] for f in list_functions(mock_session, filter)]
+
+    assert _names(None) == ["foo", "bar", "baz"]
+    assert _names("all") == ["foo", "bar", "baz"]
+    assert _names("installed") == ["bar"]
+    assert _names("not-installed") == ["foo", "baz"]
@@ -1,4 +1,5 @@
 import boto3
+from copy import deepcopy
 from click import UsageError
 from moto import mock_lambda
 import pytest
@@ -199,7 +200,7 @@ def test_add_new_relic(aws_credentials, mock_function_config):
             layer_selection(mock_layers, "python3.7", "x86_64")
 
     config = mock_function_config("python3.7")
-    _add_new_relic(
+    update_kwargs = _add_new_relic(
         layer_install(
             session=session,
             aws_region="us-east-1",
@@ -211,10 +212,7 @@ def test_add_new_relic(aws_credentials, mock_function_config):
         config,
         "foobarbaz",
     )
-    assert (
-        "NEW_RELIC_TELEMETRY_ENDPOINT"
-        in config["Configuration"]["Environment"]["Variables"]
-    )
+    assert "NEW_RELIC_TELEMETRY_ENDPOINT" in update_kwargs["Environment"]["Variables"]
 
     config = mock_function_config("python3.7")
     config["Configuration"]["Environment"]["Variables"]["NEW_RELIC_FOO"] = "bar"
@@ -253,6 +251,30 @@ def test_add_new_relic(aws_credentials, mock_function_config):
     )
 
 
+@mock_lambda
+def test_add_new_relic_does_not_mutate_config(aws_credentials, mock_function_config):
+    session = boto3.Session(region_name="us-east-1")
+
+    config = mock_function_config("python3.7")
+    original_config = deepcopy(config)
+
+    update_kwargs = _add_new_relic(
+        layer_install(
+            session=session,
+            aws_region="us-east-1",
+            nr_account_id=12345,
+            layer_arn=get_arn_prefix("us-east-1") + ":layer:NewRelicPython37:1",
+            enable_extension=True,
+            enable_extension_function_logs=True,
+        ),
+        config,
+        nr_license_key="foobarbaz",
+    )
+
+    assert update_kwargs["Environment"]["Variables"]["NEW_RELIC_ACCOUNT_ID"] == "12345"
+    assert config == original_config
+
+
 @mock_lambda
 def test_remove_new_relic(aws_credentials, mock_function_config):
     session = boto3.Session(region_name="us-east-1")
@@ -272,6 +294,10 @@ def test_remove_new_relic(aws_credentials, mock_function_config):
     assert not any(
         [k.startswith("NEW_RELIC") for k in update_kwargs["Environment"]["Variables"]]
     )
+    assert (
+        config["Configuration"]["Environment"]["Variables"]["NEW_RELIC_LAMBDA_HANDLER"]
+        == "original_handler"
+    )
 
     config = mock_function_config("not.a.runtime")
     assert (
@@ -308,6 +334,30 @@ def test_remove_new_relic(aws_credentials, mock_function_config):
         [k.startswith("NEW_RELIC") for k in update_kwargs["Environment"]["Variables"]]
     )
 
+    config = mock_function_config("python3.7")
+    config["Configuration"]["Handler"] = "newrelic_lambda_wrapper.handler"
+    config["Configuration"]["Layers"] = [
+        {"Arn": get_arn_prefix("us-east-1") + ":layer:NewRelicPython37:1"},
+        {"Arn": "existing_layer_arn"},
+        {"Arn": get_arn_prefix("us-east-1") + ":layer:NewRelicLambdaExtension:1"},
+    ]
+
+    update_kwargs = _remove_new_relic(
+        layer_uninstall(session=session, aws_region="us-east-1"), config
+    )
+
+    assert update_kwargs["Layers"] == ["existing_layer_arn"]
+
+    config = mock_function_config("python3.7")
+    config["Configuration"]["Handler"] = "newrelic_lambda_wrapper.handler"
+    del config["Configuration"]["Layers"]
+
+    update_kwargs = _remove_new_relic(
+        layer_uninstall(session=session, aws_region="us-east-1"), config
+    )
+
+    assert update_kwargs["Layers"] == []
+
 
 def test__attach_license_key_policy():
     mock_session = MagicMock()
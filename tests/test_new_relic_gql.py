@@ -1,6 +1,14 @@
 from unittest.mock import Mock, MagicMock, patch
 
-from newrelic_lambda_cli.api import NewRelicGQL
+import requests
+from requests.cookies import create_cookie, MockRequest
+
+from newrelic_lambda_cli.api import (
+    INTEGRATION_SERVICES_QUERY,
+    LINKED_ACCOUNTS_QUERY,
+    NewRelicGQL,
+    _parse_query,
+)
 
 
 @patch("newrelic_lambda_cli.api.failure")
@@ -16,3 +24,89 @@ def test_link_account_with_errors(failure):
         "Error while linking account with New Relic:\nFoo Bar"
     )
     assert account == None
+
+
+def test_query_executes_parsed_document():
+    mock_gql = NewRelicGQL("123456789", "foobar")
+    mock_gql.client = MagicMock()
+    mock_gql.client.execute.return_value = {
+        "actor": {"account": {"cloud": {"linkedAccounts": []}}}
+    }
+
+    assert mock_gql.get_linked_accounts() == []
+    mock_gql.client.execute.assert_called_once_with(
+        _parse_query(LINKED_ACCOUNTS_QUERY),
+        timeout=None,
+        variable_values={"accountId": 123456789},
+    )
+    assert _parse_query(LINKED_ACCOUNTS_QUERY) is _parse_query(LINKED_ACCOUNTS_QUERY)
+
+
+def test_transport_session_is_shared():
+    first = NewRelicGQL("123456789", "foobar")
+    second = NewRelicGQL("987654321", "barbaz", region="eu")
+
+    assert first.client.transport.session is second.client.transport.session
+    assert first.client.transport.headers == {"api-key": "foobar"}
+    assert second.client.transport.headers == {"api-key": "barbaz"}
+
+
+def test_linked_accounts_are_cached():
+    mock_gql = NewRelicGQL("123456789", "foobar")
+    mock_gql.query = Mock(
+        return_value={
+            "actor": {
+                "account": {
+                    "cloud": {
+                        "linkedAccounts": [
+                            {"id": 1, "externalId": "123456789", "name": "Foo Bar"}
+                        ]
+                    }
+                }
+            }
+        }
+    )
+
+    assert mock_gql.get_linked_account_by_external_id("123456789")["id"] == 1
+    assert mock_gql.get_linked_account_by_id(1)["name"] == "Foo Bar"
+    assert mock_gql.query.call_count == 1
+
+    mock_gql.unlink_account(1)
+    mock_gql.get_linked_accounts()
+    assert mock_gql.query.call_count == 3
+
+
+def test_is_integration_enabled():
+    mock_gql = NewRelicGQL("123456789", "foobar")
+    mock_gql.query = Mock(
+        return_value={
+            "actor": {
+                "account": {
+                    "cloud": {
+                        "linkedAccount": {
+                            "integrations": [
+                                {"service": {"slug": "sqs", "isEnabled": True}},
+                                {"service": {"slug": "lambda", "isEnabled": False}},
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+    )
+
+    assert mock_gql.is_integration_enabled(1, "sqs") is True
+    assert mock_gql.is_integration_enabled(1, "lambda") is False
+    assert mock_gql.is_integration_enabled(1, "s3") is False
+    assert mock_gql.query.call_args[0][0] == INTEGRATION_SERVICES_QUERY
+
+    mock_gql.query = Mock(return_value={"actor": {"account": {}}})
+    assert mock_gql.is_integration_enabled(1, "lambda") is False
+
+
+def test_transport_session_refuses_cookies():
+    session = NewRelicGQL("123456789", "foobar").client.transport.session
+    cookie = create_cookie("session", "foobar", domain="api.newrelic.com")
+    request = requests.Request("POST", "https://api.newrelic.com/graphql").prepare()
+
+    assert session.cookies._policy.set_ok(cookie, MockRequest(request)) is False
@@ -1,5 +1,7 @@
 import pytest
 
+from unittest.mock import MagicMock
+
 from botocore.exceptions import BotoCoreError, NoCredentialsError, NoRegionError
 from click.exceptions import BadParameter, UsageError
 
@@ -9,7 +11,9 @@ from newrelic_lambda_cli.utils import (
     parse_arn,
     validate_aws_profile,
     catch_boto_errors,
+    get_lambda_client,
     supports_lambda_extension,
+    LAMBDA_CLIENT_CONFIG,
 )
 
 
@@ -92,3 +96,10 @@ def test_supports_lambda_extension():
     assert not any(
         supports_lambda_extension(runtime) for runtime in ("python2.7", "python3.6")
     )
+
+
+def test_get_lambda_client():
+    session = MagicMock()
+
+    assert get_lambda_client(session) is session.client.return_value
+    session.client.assert_called_once_with("lambda", config=LAMBDA_CLIENT_CONFIG)